@@ -5,11 +5,18 @@ Implements LSB embedding and extraction for WAV files.
 
 from __future__ import annotations
 
+import functools
 import hashlib
+import mmap
+import os
 import random
+import struct
 import wave
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Iterable, List, Tuple, Union
+from typing import Callable, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
 
 DELIMITER = b"###END###"
 SUPPORTED_SAMPLE_WIDTHS = {1, 2, 3, 4}
@@ -17,6 +24,13 @@ MIN_PASSWORD_LENGTH = 8
 EMBED_KDF_SALT = b"SonicCipher|Embedding"
 EMBED_KDF_ITERATIONS = 120_000
 HIGH_ENERGY_PERCENTILE = 0.6
+EXTRACT_CHUNK_BYTES = 8192
+STREAM_BLOCK_BYTES = 1 << 20
+_WAVE_FORMAT_PCM = 0x0001
+_WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+_FrameBuffer = Union[bytearray, memoryview]
+_FileKey = Tuple[str, int, int]
 
 
 class StegoError(Exception):
@@ -35,77 +49,173 @@ def _validate_password(password: str) -> bytes:
     return password.encode("utf-8")
 
 
-def _derive_embedding_seed(password: str) -> int:
-    password_bytes = _validate_password(password)
-    key = hashlib.pbkdf2_hmac(
+# The iteration count stays high on purpose: the same password keys the
+# Fernet layer, so a cheap seed KDF would let guesses be tested against the
+# embedding order instead.
+def _pbkdf2(password_bytes: bytes) -> bytes:
+    return hashlib.pbkdf2_hmac(
         "sha256",
         password_bytes,
         EMBED_KDF_SALT,
         EMBED_KDF_ITERATIONS,
         dklen=32,
     )
-    return int.from_bytes(key, byteorder="big", signed=False)
 
 
-def _iter_keyed_positions(positions: List[int], password: str) -> Iterable[int]:
-    if not positions:
+# Holds at most 32 derived 32-byte keys (1 KiB). The salt is fixed, so a hit
+# reveals that the password was used recently; only single-user callers such
+# as the desktop GUI should opt in.
+_cached_pbkdf2 = functools.lru_cache(maxsize=32)(_pbkdf2)
+
+
+def _embedding_key(password: str, cache: bool = False) -> bytes:
+    password_bytes = _validate_password(password)
+    return _cached_pbkdf2(password_bytes) if cache else _pbkdf2(password_bytes)
+
+
+def _mix64(values: np.ndarray) -> np.ndarray:
+    # splitmix64 finalizer; uint64 array arithmetic wraps silently.
+    values = (values ^ (values >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    values = (values ^ (values >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return values ^ (values >> np.uint64(31))
+
+
+class _KeyedOrder:
+    """Password-keyed permutation of embedding positions.
+
+    Slicing evaluates only the requested part of the order, so hiding a
+    short payload or finding an early delimiter costs O(k) rather than a
+    shuffle of every position. The order is a 4-round Feistel network over
+    the index range, cycle-walked back into ``[0, size)``.
+    """
+
+    def __init__(self, positions: np.ndarray, key: bytes) -> None:
+        if not positions.size:
+            raise StegoError("No eligible samples for embedding.")
+        self.size = positions.size
+        self._positions = positions
+        self._round_keys = np.frombuffer(key, dtype="<u8").astype(np.uint64)
+        half_bits = max(1, ((self.size - 1).bit_length() + 1) // 2)
+        self._shift = np.uint64(half_bits)
+        self._mask = np.uint64((1 << half_bits) - 1)
+
+    def __getitem__(self, index: slice) -> np.ndarray:
+        indices = np.arange(*index.indices(self.size), dtype=np.uint64)
+        return self._positions[self._permute(indices).astype(np.intp)]
+
+    def _encrypt(self, values: np.ndarray) -> np.ndarray:
+        left = values >> self._shift
+        right = values & self._mask
+        for round_key in self._round_keys:
+            left, right = right, left ^ (_mix64(right + round_key) & self._mask)
+        return (left << self._shift) | right
+
+    def _permute(self, indices: np.ndarray) -> np.ndarray:
+        permuted = self._encrypt(indices)
+        pending = np.flatnonzero(permuted >= self.size)
+        while pending.size:
+            permuted[pending] = self._encrypt(permuted[pending])
+            pending = pending[permuted[pending] >= self.size]
+        return permuted
+
+
+def _legacy_keyed_positions_array(positions: np.ndarray, key: bytes) -> np.ndarray:
+    """Return the random.Random embedding order used by Sonic Cipher 1.0.0.
+
+    Files carry no format marker, so extract_data falls back to this order
+    when the keyed Feistel order finds no delimiter.
+    """
+
+    if not positions.size:
         raise StegoError("No eligible samples for embedding.")
-    seed = _derive_embedding_seed(password)
+    seed = int.from_bytes(key, byteorder="big", signed=False)
     rng = random.Random(seed)
-    shuffled = positions[:]
+    shuffled = positions.tolist()
     rng.shuffle(shuffled)
-    for pos in shuffled:
-        yield pos
+    return np.array(shuffled, dtype=positions.dtype)
 
 
-def _decode_sample_value(
-    chunk: memoryview, sampwidth: int, mask_lsb: bool
-) -> int:
-    if sampwidth == 1:
-        val = chunk[0] - 128
-    else:
-        val = int.from_bytes(chunk, byteorder="little", signed=True)
-    if mask_lsb:
-        val &= ~1
-    return val
+@functools.lru_cache(maxsize=None)
+def _decode24_kernel() -> Optional[Callable[[np.ndarray, np.ndarray], None]]:
+    """Return the numba 24-bit decoder, or None when numba is not installed.
+
+    Importing numba takes a few hundred milliseconds, so it is deferred until
+    the first 24-bit file instead of slowing down GUI and server start-up.
+    """
+
+    try:
+        import numba
+    except ImportError:
+        return None
+
+    # Serial on purpose: the decode is memory-bound, and parallel kernels
+    # are not safe to launch from several threads under numba's default
+    # workqueue threading layer (batch helpers, threaded servers).
+    @numba.njit(cache=True)
+    def decode24(buf: np.ndarray, out: np.ndarray) -> None:
+        for i in range(out.size):
+            value = (
+                np.int32(buf[3 * i])
+                | (np.int32(buf[3 * i + 1]) << 8)
+                | (np.int32(buf[3 * i + 2]) << 16)
+            )
+            # Branchless sign extension of the 24-bit value.
+            out[i] = value - ((value & 0x800000) << 1)
+
+    return decode24
 
 
 def _read_sample_values(
-    frame_bytes: bytearray, sampwidth: int, mask_lsb: bool = False
-) -> List[int]:
-    samples: List[int] = []
-    view = memoryview(frame_bytes)
-    for i in range(0, len(view), sampwidth):
-        chunk = view[i : i + sampwidth]
-        samples.append(_decode_sample_value(chunk, sampwidth, mask_lsb))
+    frame_bytes: _FrameBuffer, sampwidth: int, mask_lsb: bool = False
+) -> np.ndarray:
+    raw = np.frombuffer(frame_bytes, dtype=np.uint8)
+    raw = raw[: len(raw) - len(raw) % sampwidth]
+    if sampwidth in (2, 4):
+        samples = raw.view(f"<i{sampwidth}")
+        # These are views of the caller's buffer, so mask into a new array.
+        return samples & ~1 if mask_lsb else samples
+    decode24 = _decode24_kernel() if sampwidth == 3 else None
+    if sampwidth == 1:
+        samples = raw.astype(np.int16) - 128
+    elif decode24 is not None:
+        samples = np.empty(raw.size // 3, dtype=np.int32)
+        decode24(raw, samples)
+    else:
+        triplets = raw.reshape(-1, 3)
+        samples = (
+            triplets[:, 0].astype(np.int32)
+            | (triplets[:, 1].astype(np.int32) << 8)
+            | (triplets[:, 2].view(np.int8).astype(np.int32) << 16)
+        )
+    if mask_lsb:
+        samples &= ~1
     return samples
 
 
 def _read_sample_energies(
-    frame_bytes: bytearray, sampwidth: int, mask_lsb: bool = True
-) -> List[int]:
-    energies: List[int] = []
-    view = memoryview(frame_bytes)
-    for i in range(0, len(view), sampwidth):
-        chunk = view[i : i + sampwidth]
-        val = _decode_sample_value(chunk, sampwidth, mask_lsb)
-        energies.append(abs(val))
-    return energies
+    frame_bytes: _FrameBuffer, sampwidth: int, mask_lsb: bool = True
+) -> np.ndarray:
+    samples = _read_sample_values(frame_bytes, sampwidth, mask_lsb)
+    # Masked samples are always decoded into a fresh array, so abs() can
+    # reuse it instead of allocating another N-element buffer.
+    out = samples if mask_lsb else None
+    # abs() of the most negative value wraps; the unsigned view restores it.
+    magnitudes = np.abs(samples, out=out)
+    return magnitudes.view(f"u{magnitudes.itemsize}")
 
 
 def _select_high_energy_positions(
-    frame_bytes: bytearray, sampwidth: int
-) -> List[int]:
+    frame_bytes: _FrameBuffer, sampwidth: int
+) -> np.ndarray:
     energies = _read_sample_energies(frame_bytes, sampwidth, mask_lsb=True)
-    if not energies:
+    if not energies.size:
         raise StegoError("Audio has no samples available for embedding.")
-    sorted_energies = sorted(energies)
-    cutoff_index = int(len(sorted_energies) * HIGH_ENERGY_PERCENTILE)
-    if cutoff_index >= len(sorted_energies):
-        cutoff_index = len(sorted_energies) - 1
-    threshold = sorted_energies[cutoff_index]
-    positions = [i for i, energy in enumerate(energies) if energy >= threshold]
-    if not positions:
+    cutoff_index = int(energies.size * HIGH_ENERGY_PERCENTILE)
+    if cutoff_index >= energies.size:
+        cutoff_index = energies.size - 1
+    threshold = np.partition(energies, cutoff_index)[cutoff_index]
+    positions = np.flatnonzero(energies >= threshold)
+    if not positions.size:
         raise StegoError("No high-energy samples available for embedding.")
     return positions
 
@@ -126,47 +236,153 @@ def _validate_output_path(path: Union[str, Path]) -> Path:
     return out_path
 
 
-def _bytes_to_bits(data: bytes) -> Iterable[int]:
-    for byte_val in data:
-        for bit_index in range(7, -1, -1):
-            yield (byte_val >> bit_index) & 1
-
+def _same_path(a: Path, b: Path) -> bool:
+    if os.path.abspath(a) == os.path.abspath(b):
+        return True
+    try:
+        return os.path.samefile(a, b)
+    except OSError:
+        # The output does not exist yet, so it cannot alias the input.
+        return False
 
-def _bits_to_byte(bits: Iterable[int]) -> int:
-    value = 0
-    for bit in bits:
-        value = (value << 1) | bit
-    return value
 
+def calculate_capacity(path: Union[str, Path], cache: bool = False) -> int:
+    """Return max payload bytes available for this WAV (excluding delimiter).
 
-def calculate_capacity(path: Union[str, Path]) -> int:
-    """Return max payload bytes available for this WAV (excluding delimiter)."""
+    With ``cache`` enabled, an unchanged file (same path, mtime and size) is
+    answered from the cached high-energy scan after a single stat call. The
+    cache is process-wide, so only enable it for files that outlive the call.
+    """
 
     wav_path = _validate_wav_path(path)
-    params, frame_bytes = _read_wave(wav_path)
-    positions = _select_high_energy_positions(frame_bytes, params.sampwidth)
+    if cache:
+        positions = _cached_positions(_file_key(wav_path))
+    else:
+        params, frame_bytes = _map_wave(wav_path)
+        positions = _select_high_energy_positions(frame_bytes, params.sampwidth)
     max_payload = len(positions) // 8
     available = max_payload - len(DELIMITER)
     return max(0, available)
 
 
-def _read_wave(path: Path) -> Tuple[wave._wave_params, bytearray]:
-    with wave.open(str(path), "rb") as wf:
-        params = wf.getparams()
-        if params.sampwidth not in SUPPORTED_SAMPLE_WIDTHS:
-            raise StegoError("Unsupported sample width.")
-        if params.comptype != "NONE":
-            raise StegoError("Compressed WAV files are not supported.")
-        if params.nframes <= 0:
-            raise StegoError("WAV file has no audio frames.")
-        frames = wf.readframes(params.nframes)
-    return params, bytearray(frames)
+def _parse_wave_header(buf: mmap.mmap) -> Tuple[wave._wave_params, int, int]:
+    """Walk the RIFF chunks in ``buf`` and return (params, data offset, length)."""
+
+    if len(buf) < 12 or buf[0:4] != b"RIFF" or buf[8:12] != b"WAVE":
+        raise StegoError("File is not a RIFF/WAVE file.")
+    fmt = None
+    offset = 12
+    while offset + 8 <= len(buf):
+        chunk_id, chunk_size = struct.unpack_from("<4sI", buf, offset)
+        offset += 8
+        if chunk_id == b"fmt " and chunk_size >= 16 and offset + 16 <= len(buf):
+            fmt = struct.unpack_from("<HHIIHH", buf, offset)
+            if fmt[0] == _WAVE_FORMAT_EXTENSIBLE and chunk_size >= 40:
+                # The real format tag leads the SubFormat GUID.
+                (sub_format,) = struct.unpack_from("<H", buf, offset + 24)
+                fmt = (sub_format,) + fmt[1:]
+        elif chunk_id == b"data":
+            break
+        offset += chunk_size + (chunk_size & 1)
+    else:
+        raise StegoError("WAV file has no data chunk.")
+    if fmt is None:
+        raise StegoError("WAV file has no format chunk before its data.")
+
+    format_tag, nchannels, framerate, _, _, bits_per_sample = fmt
+    if format_tag != _WAVE_FORMAT_PCM:
+        raise StegoError("Compressed WAV files are not supported.")
+    sampwidth = (bits_per_sample + 7) // 8
+    if sampwidth not in SUPPORTED_SAMPLE_WIDTHS:
+        raise StegoError("Unsupported sample width.")
+    if nchannels <= 0:
+        raise StegoError("WAV file has no audio channels.")
+
+    frame_size = nchannels * sampwidth
+    data_len = min(chunk_size, len(buf) - offset)
+    nframes = data_len // frame_size
+    if nframes <= 0:
+        raise StegoError("WAV file has no audio frames.")
+    params = wave._wave_params(
+        nchannels, sampwidth, framerate, nframes, "NONE", "not compressed"
+    )
+    return params, offset, nframes * frame_size
+
 
+def _map_wave(path: Path) -> Tuple[wave._wave_params, memoryview]:
+    """Return the WAV parameters and a read-only, zero-copy view of its PCM data.
+
+    The header is parsed straight from the mapping, so the file is opened
+    once and only the pages that are touched get read.  The mapping stays
+    open for as long as the returned view is referenced.
+    """
+
+    with open(path, "rb") as fh:
+        try:
+            mapped = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError as exc:  # empty file
+            raise StegoError("File is not a RIFF/WAVE file.") from exc
+    try:
+        params, data_start, data_len = _parse_wave_header(mapped)
+    except BaseException:
+        # Don't leave the file mapped while the traceback is alive; on
+        # Windows that blocks deleting or replacing it.
+        mapped.close()
+        raise
+    return params, memoryview(mapped)[data_start : data_start + data_len]
+
+
+def _file_key(path: Path) -> _FileKey:
+    st = path.stat()
+    return os.path.abspath(path), st.st_mtime_ns, st.st_size
+
+
+# Position arrays are ~3 bytes per sample, so only the last couple of files
+# are kept; that covers the GUI's capacity-check-then-hide flow.
+@functools.lru_cache(maxsize=2)
+def _cached_positions(file_key: _FileKey) -> np.ndarray:
+    params, frame_bytes = _map_wave(Path(file_key[0]))
+    positions = _select_high_energy_positions(frame_bytes, params.sampwidth)
+    positions.flags.writeable = False
+    return positions
+
+
+def _high_energy_positions(
+    frame_bytes: _FrameBuffer, sampwidth: int, file_key: Optional[_FileKey]
+) -> np.ndarray:
+    if file_key is None:
+        return _select_high_energy_positions(frame_bytes, sampwidth)
+    return _cached_positions(file_key)
+
+
+def _write_embedded_wave(
+    path: Path,
+    params: wave._wave_params,
+    frames: memoryview,
+    byte_indices: np.ndarray,
+    bits: np.ndarray,
+) -> None:
+    """Copy ``frames`` to ``path`` block by block, setting LSBs on the way.
+
+    Only one block of the output is held in memory at a time.
+    """
+
+    order = np.argsort(byte_indices)
+    byte_indices = byte_indices[order]
+    bits = bits[order]
+    frame_size = params.nchannels * params.sampwidth
+    block_bytes = max(frame_size, STREAM_BLOCK_BYTES // frame_size * frame_size)
 
-def _write_wave(path: Path, params: wave._wave_params, frames: bytes) -> None:
     with wave.open(str(path), "wb") as wf:
         wf.setparams(params)
-        wf.writeframes(frames)
+        for start in range(0, len(frames), block_bytes):
+            block = bytearray(frames[start : start + block_bytes])
+            lo, hi = np.searchsorted(byte_indices, (start, start + len(block)))
+            if hi > lo:
+                local = byte_indices[lo:hi] - start
+                block_arr = np.frombuffer(block, dtype=np.uint8)
+                block_arr[local] = (block_arr[local] & 0xFE) | bits[lo:hi]
+            wf.writeframesraw(block)
 
 
 def hide_data(
@@ -174,18 +390,25 @@ def hide_data(
     out_path: Union[str, Path],
     payload: bytes,
     password: str,
+    cache: bool = False,
+    cache_seed: bool = False,
 ) -> None:
-    """Hide payload bytes inside a WAV file using adaptive keyed embedding."""
+    """Hide payload bytes inside a WAV file using adaptive keyed embedding.
+
+    ``cache`` reuses positions computed for the same unchanged input file.
+    ``cache_seed`` reuses the password-derived embedding key; leave it off
+    in processes shared by several users.
+    """
 
     if not isinstance(payload, (bytes, bytearray)) or not payload:
         raise StegoError("Payload must be non-empty bytes.")
 
     wav_path = _validate_wav_path(in_path)
     out_path = _validate_output_path(out_path)
-    if wav_path.resolve() == out_path.resolve():
+    if _same_path(wav_path, out_path):
         raise StegoError("Output path must be different from input path.")
 
-    params, frame_bytes = _read_wave(wav_path)
+    params, frame_bytes = _map_wave(wav_path)
     full_payload = bytes(payload) + DELIMITER
     required_bits = len(full_payload) * 8
     if required_bits > params.nframes * params.nchannels:
@@ -193,42 +416,93 @@ def hide_data(
             "Message too large for this audio file. Reduce size or use a larger WAV."
         )
 
-    bit_iter = _bytes_to_bits(full_payload)
-    positions = _select_high_energy_positions(frame_bytes, params.sampwidth)
+    file_key = _file_key(wav_path) if cache else None
+    positions = _high_energy_positions(frame_bytes, params.sampwidth, file_key)
     if required_bits > len(positions):
         raise StegoError(
             "Message too large for high-energy embedding. Use a larger WAV or shorter message."
         )
-    keyed_positions = _iter_keyed_positions(positions, password)
-    for bit in bit_iter:
-        sample_index = next(keyed_positions)
-        byte_index = sample_index * params.sampwidth
-        frame_bytes[byte_index] = (frame_bytes[byte_index] & 0xFE) | bit
+    key = _embedding_key(password, cache_seed)
+    keyed = _KeyedOrder(positions, key)[:required_bits]
+    bits = np.unpackbits(np.frombuffer(full_payload, dtype=np.uint8))
+    byte_indices = keyed * params.sampwidth
+    _write_embedded_wave(out_path, params, frame_bytes, byte_indices, bits)
+
+
+def _collect_payload(
+    frame_bytes: _FrameBuffer,
+    sampwidth: int,
+    keyed_positions: Union[_KeyedOrder, np.ndarray],
+) -> Optional[bytes]:
+    frame_arr = np.frombuffer(frame_bytes, dtype=np.uint8)
+    usable_bits = keyed_positions.size - keyed_positions.size % 8
+    chunk_bits = EXTRACT_CHUNK_BYTES * 8
+    collected = bytearray()
 
-    _write_wave(out_path, params, bytes(frame_bytes))
+    for start in range(0, usable_bits, chunk_bits):
+        chunk = keyed_positions[start : min(start + chunk_bits, usable_bits)]
+        lsbs = frame_arr[chunk * sampwidth] & 1
+        search_from = max(0, len(collected) - len(DELIMITER) + 1)
+        collected += np.packbits(lsbs).tobytes()
+        end = collected.find(DELIMITER, search_from)
+        if end != -1:
+            return bytes(collected[:end])
+    return None
 
 
-def extract_data(path: Union[str, Path], password: str) -> bytes:
-    """Extract payload bytes from a WAV file using adaptive keyed embedding."""
+def extract_data(
+    path: Union[str, Path],
+    password: str,
+    cache: bool = False,
+    cache_seed: bool = False,
+) -> bytes:
+    """Extract payload bytes from a WAV file using adaptive keyed embedding.
+
+    ``cache`` and ``cache_seed`` work as in :func:`hide_data`.
+    """
 
     wav_path = _validate_wav_path(path)
-    params, frame_bytes = _read_wave(wav_path)
+    params, frame_bytes = _map_wave(wav_path)
+
+    file_key = _file_key(wav_path) if cache else None
+    positions = _high_energy_positions(frame_bytes, params.sampwidth, file_key)
+    key = _embedding_key(password, cache_seed)
+    payload = _collect_payload(
+        frame_bytes,
+        params.sampwidth,
+        _KeyedOrder(positions, key),
+    )
+    if payload is None:
+        payload = _collect_payload(
+            frame_bytes,
+            params.sampwidth,
+            _legacy_keyed_positions_array(positions, key),
+        )
+    if payload is not None:
+        return payload
 
-    collected = bytearray()
-    bit_buffer = []
+    raise StegoError("Delimiter not found. Wrong password or no hidden message.")
 
-    positions = _select_high_energy_positions(frame_bytes, params.sampwidth)
-    keyed_positions = _iter_keyed_positions(positions, password)
-    for sample_index in keyed_positions:
-        byte_index = sample_index * params.sampwidth
-        bit_buffer.append(frame_bytes[byte_index] & 1)
-        if len(bit_buffer) == 8:
-            collected.append(_bits_to_byte(bit_buffer))
-            bit_buffer.clear()
-            if collected.endswith(DELIMITER):
-                return bytes(collected[:-len(DELIMITER)])
 
-    raise StegoError("Delimiter not found. Wrong password or no hidden message.")
+def calculate_capacity_batch(paths: Iterable[Union[str, Path]]) -> List[int]:
+    """Return the capacity of each WAV, scanning files in parallel threads."""
+
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+        return list(pool.map(calculate_capacity, paths))
+
+
+def extract_batch(
+    paths: Iterable[Union[str, Path]], password: str, cache_seed: bool = False
+) -> List[bytes]:
+    """Extract the payload of each WAV, processing files in parallel threads."""
+
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+        return list(
+            pool.map(
+                lambda path: extract_data(path, password, cache_seed=cache_seed),
+                paths,
+            )
+        )
 
 
 def plot_waveform_comparison(
@@ -249,26 +523,27 @@ def plot_waveform_comparison(
     orig = _validate_wav_path(original_path)
     steg = _validate_wav_path(stego_path)
 
-    def read_samples(path: Path) -> Tuple[int, list[int]]:
-        params, frame_bytes = _read_wave(path)
+    def read_samples(path: Path) -> Tuple[int, np.ndarray, np.ndarray]:
+        params, frame_bytes = _map_wave(path)
         samples = _read_sample_values(frame_bytes, params.sampwidth)
-        if len(samples) > max_points:
-            stride = max(1, len(samples) // max_points)
-            samples = samples[::stride]
-        return params.framerate, samples
-
-    rate_orig, samples_orig = read_samples(orig)
-    rate_steg, samples_steg = read_samples(steg)
+        # Reduce each block to its min/max so the envelope survives
+        # downsampling instead of aliasing like plain stride slicing.
+        stride = max(1, samples.size // max_points)
+        blocks = samples[: samples.size - samples.size % stride].reshape(-1, stride)
+        return params.framerate, blocks.min(axis=1), blocks.max(axis=1)
+
+    rate_orig, low_orig, high_orig = read_samples(orig)
+    rate_steg, low_steg, high_steg = read_samples(steg)
     if rate_orig != rate_steg:
         raise StegoError("Sample rates do not match for comparison.")
 
-    x_orig = list(range(len(samples_orig)))
-    x_steg = list(range(len(samples_steg)))
+    x_orig = np.arange(low_orig.size)
+    x_steg = np.arange(low_steg.size)
 
     fig, axes = plt.subplots(2, 1, figsize=(10, 6), sharex=True)
-    axes[0].plot(x_orig, samples_orig, color="#1f77b4")
+    axes[0].fill_between(x_orig, low_orig, high_orig, color="#1f77b4", linewidth=0.5)
     axes[0].set_title("Original Waveform")
-    axes[1].plot(x_steg, samples_steg, color="#ff7f0e")
+    axes[1].fill_between(x_steg, low_steg, high_steg, color="#ff7f0e", linewidth=0.5)
     axes[1].set_title("Stego Waveform")
     for ax in axes:
         ax.set_ylabel("Amplitude")
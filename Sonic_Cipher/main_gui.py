@@ -3,14 +3,25 @@
 from __future__ import annotations
 
 import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Optional
 from tkinter import filedialog, messagebox, ttk
 
 import audio_stego
 import security
 
 
+def _plot_worker(conn: Any, orig_path: str, steg_path: str) -> None:
+    # Runs in a child process; errors are sent back for the GUI to show.
+    try:
+        audio_stego.plot_waveform_comparison(orig_path, steg_path)
+    except Exception as exc:
+        conn.send(str(exc))
+    finally:
+        conn.close()
+
+
 class SonicCipherApp(tk.Tk):
     def __init__(self) -> None:
         super().__init__()
@@ -27,6 +38,10 @@ class SonicCipherApp(tk.Tk):
         self.reveal_input_path = tk.StringVar(value="")
         self.reveal_password_var = tk.StringVar(value="")
 
+        # KDF, crypto and stego work runs here so the Tk mainloop stays live.
+        self._executor = ThreadPoolExecutor(max_workers=2)
+        self._active_jobs = 0
+
         self._build_ui()
 
     def _build_ui(self) -> None:
@@ -43,6 +58,8 @@ class SonicCipherApp(tk.Tk):
 
         tools_frame = ttk.Frame(self)
         tools_frame.pack(fill="x", padx=12, pady=(0, 12))
+        self.progress = ttk.Progressbar(tools_frame, mode="indeterminate", length=160)
+        self.progress.pack(side="left")
         ttk.Button(
             tools_frame, text="Compare Waveforms", command=self._compare_waveforms
         ).pack(side="right")
@@ -53,6 +70,35 @@ class SonicCipherApp(tk.Tk):
     def _show_info(self, message: str) -> None:
         messagebox.showinfo("Success", message)
 
+    def _run_in_background(
+        self,
+        work: Callable[[], Any],
+        on_success: Callable[[Any], None],
+        button: ttk.Button,
+    ) -> None:
+        button.state(["disabled"])
+        if not self._active_jobs:
+            self.progress.start(10)
+        self._active_jobs += 1
+        future = self._executor.submit(work)
+
+        def poll() -> None:
+            if not future.done():
+                self.after(50, poll)
+                return
+            self._active_jobs -= 1
+            if not self._active_jobs:
+                self.progress.stop()
+            button.state(["!disabled"])
+            try:
+                result = future.result()
+            except Exception as exc:
+                self._show_error(str(exc))
+                return
+            on_success(result)
+
+        self.after(50, poll)
+
     def _pick_wav(self, title: str) -> str:
         return filedialog.askopenfilename(
             title=title,
@@ -98,9 +144,10 @@ class SonicCipherApp(tk.Tk):
             variable=self.hide_compress_var,
         ).pack(anchor="w", padx=8, pady=6)
 
-        ttk.Button(
+        self.hide_button = ttk.Button(
             parent, text="ENCRYPT & HIDE", command=self._handle_hide
-        ).pack(pady=6)
+        )
+        self.hide_button.pack(pady=6)
 
     def _build_reveal_tab(self, parent: ttk.Frame) -> None:
         file_frame = ttk.LabelFrame(parent, text="Secret WAV")
@@ -118,9 +165,10 @@ class SonicCipherApp(tk.Tk):
             fill="x", padx=8, pady=8
         )
 
-        ttk.Button(
+        self.reveal_button = ttk.Button(
             parent, text="DECRYPT & EXTRACT", command=self._handle_reveal
-        ).pack(pady=6)
+        )
+        self.reveal_button.pack(pady=6)
 
         out_frame = ttk.LabelFrame(parent, text="Decrypted Message")
         out_frame.pack(fill="both", expand=True, padx=8, pady=8)
@@ -135,7 +183,7 @@ class SonicCipherApp(tk.Tk):
 
         self.hide_input_path.set(path)
         try:
-            self.hide_capacity_bytes = audio_stego.calculate_capacity(path)
+            self.hide_capacity_bytes = audio_stego.calculate_capacity(path, cache=True)
             self.hide_capacity_var.set(f"Capacity: {self.hide_capacity_bytes} bytes")
         except Exception as exc:
             self._show_error(str(exc))
@@ -149,8 +197,10 @@ class SonicCipherApp(tk.Tk):
         self.reveal_input_path.set(path)
 
     def _update_message_length(self, _event: Optional[tk.Event] = None) -> None:
-        text = self.hide_message_text.get("1.0", "end-1c")
-        self.hide_message_len_var.set(f"Message length: {len(text)} chars")
+        # Let Tk count the characters instead of copying the text out.
+        count = self.hide_message_text.count("1.0", "end-1c", "chars")
+        length = count[0] if count else 0
+        self.hide_message_len_var.set(f"Message length: {length} chars")
 
     def _handle_hide(self) -> None:
         wav_path = self.hide_input_path.get()
@@ -161,18 +211,27 @@ class SonicCipherApp(tk.Tk):
         message = self.hide_message_text.get("1.0", "end-1c")
         password = self.hide_password_var.get()
         compress = self.hide_compress_var.get()
+        # Computed when the file was selected; 0 means that check failed.
+        known_capacity = self.hide_capacity_bytes
 
-        try:
+        def prepare() -> bytes:
             encrypted = security.encrypt_message(message, password, compress=compress)
-            capacity = audio_stego.calculate_capacity(wav_path)
+            capacity = known_capacity or audio_stego.calculate_capacity(
+                wav_path, cache=True
+            )
             if len(encrypted) > capacity:
                 raise ValueError(
                     f"Encrypted payload is too large. Capacity: {capacity} bytes."
                 )
-        except Exception as exc:
-            self._show_error(str(exc))
-            return
+            return encrypted
 
+        self._run_in_background(
+            prepare,
+            lambda encrypted: self._save_hidden(wav_path, encrypted, password),
+            self.hide_button,
+        )
+
+    def _save_hidden(self, wav_path: str, encrypted: bytes, password: str) -> None:
         default_name = Path(wav_path).with_suffix("").name + "_secret.wav"
         out_path = filedialog.asksaveasfilename(
             title="Save Stego WAV",
@@ -183,13 +242,18 @@ class SonicCipherApp(tk.Tk):
         if not out_path:
             return
 
-        try:
-            audio_stego.hide_data(wav_path, out_path, encrypted, password)
-        except Exception as exc:
-            self._show_error(str(exc))
-            return
-
-        self._show_info(f"File saved to:\n{out_path}")
+        self._run_in_background(
+            lambda: audio_stego.hide_data(
+                wav_path,
+                out_path,
+                encrypted,
+                password,
+                cache=True,
+                cache_seed=True,
+            ),
+            lambda _result: self._show_info(f"File saved to:\n{out_path}"),
+            self.hide_button,
+        )
 
     def _handle_reveal(self) -> None:
         wav_path = self.reveal_input_path.get()
@@ -199,13 +263,15 @@ class SonicCipherApp(tk.Tk):
 
         password = self.reveal_password_var.get()
 
-        try:
-            payload = audio_stego.extract_data(wav_path, password)
-            message = security.decrypt_message(payload, password)
-        except Exception as exc:
-            self._show_error(str(exc))
-            return
+        def reveal() -> str:
+            payload = audio_stego.extract_data(
+                wav_path, password, cache=True, cache_seed=True
+            )
+            return security.decrypt_message(payload, password)
 
+        self._run_in_background(reveal, self._show_revealed, self.reveal_button)
+
+    def _show_revealed(self, message: str) -> None:
         self.reveal_message_text.configure(state="normal")
         self.reveal_message_text.delete("1.0", "end")
         self.reveal_message_text.insert("1.0", message)
@@ -220,10 +286,36 @@ class SonicCipherApp(tk.Tk):
         if not steg_path:
             return
 
-        try:
-            audio_stego.plot_waveform_comparison(orig_path, steg_path)
-        except Exception as exc:
-            self._show_error(str(exc))
+        # matplotlib's import and plt.show() block, so plot in a separate
+        # process and keep this window responsive.
+        import multiprocessing
+
+        # Spawn a fresh interpreter: forking would copy the live Tcl
+        # interpreter and the executor's threads into the child.
+        context = multiprocessing.get_context("spawn")
+        recv_conn, send_conn = context.Pipe(duplex=False)
+        process = context.Process(
+            target=_plot_worker,
+            args=(send_conn, orig_path, steg_path),
+            daemon=True,
+        )
+        process.start()
+        send_conn.close()
+
+        def poll() -> None:
+            if recv_conn.poll():
+                try:
+                    self._show_error(recv_conn.recv())
+                except EOFError:
+                    pass
+                recv_conn.close()
+                return
+            if process.is_alive():
+                self.after(200, poll)
+                return
+            recv_conn.close()
+
+        self.after(200, poll)
 
 
 def main() -> None:
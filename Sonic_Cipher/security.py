@@ -6,8 +6,12 @@ Handles password-based key derivation and authenticated encryption.
 from __future__ import annotations
 
 import base64
+import functools
+import math
 import os
 import zlib
+from collections import Counter
+from typing import Optional
 
 from cryptography.fernet import Fernet, InvalidToken
 from cryptography.hazmat.primitives import hashes
@@ -18,6 +22,8 @@ KDF_ITERATIONS = 200_000
 MIN_PASSWORD_LENGTH = 8
 MAGIC_HEADER = b"SC1"
 FLAG_COMPRESSED = 0x01
+ENTROPY_SAMPLE_SIZE = 1024
+COMPRESS_MAX_ENTROPY = 7.2  # bits per byte
 
 
 class SecurityError(Exception):
@@ -51,18 +57,50 @@ def _validate_plaintext(plaintext: str) -> bytes:
         raise SecurityError("Message must be valid UTF-8 text.") from exc
 
 
+# Holds at most 64 raw 32-byte keys so repeated reveal attempts on the same
+# payload (same password and salt) skip the 200k-round derivation.
+@functools.lru_cache(maxsize=64)
+def _derive_key_cached(password_bytes: bytes, salt: bytes) -> bytes:
+    kdf = PBKDF2HMAC(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=salt,
+        iterations=KDF_ITERATIONS,
+    )
+    return kdf.derive(password_bytes)
+
+
 def _derive_key(password: str, salt: bytes) -> bytes:
     if not isinstance(salt, (bytes, bytearray)) or len(salt) != SALT_SIZE:
         raise SecurityError("Invalid salt.")
 
     password_bytes = _validate_password(password)
-    kdf = PBKDF2HMAC(
-        algorithm=hashes.SHA256(),
-        length=32,
-        salt=bytes(salt),
-        iterations=KDF_ITERATIONS,
+    return base64.urlsafe_b64encode(_derive_key_cached(password_bytes, bytes(salt)))
+
+
+@functools.lru_cache(maxsize=64)
+def _fernet(key: bytes) -> Fernet:
+    return Fernet(key)
+
+
+def _should_compress(data: bytes) -> bool:
+    """Return True when a sample of ``data`` looks compressible.
+
+    Already-compressed or random data sits close to 8 bits/byte of entropy,
+    where zlib only costs time and grows the payload. The estimate is capped
+    at log2(len) bits/byte, so short inputs always pass; encrypt_message
+    keeps zlib's output only when it is actually smaller.
+    """
+
+    sample = data[:ENTROPY_SAMPLE_SIZE]
+    if not sample:
+        return False
+    total = len(sample)
+    entropy = -sum(
+        (count / total) * math.log2(count / total)
+        for count in Counter(sample).values()
     )
-    return base64.urlsafe_b64encode(kdf.derive(password_bytes))
+    return entropy < COMPRESS_MAX_ENTROPY
 
 
 def _split_payload(payload: bytes) -> tuple[bytes, bytes, bool]:
@@ -81,18 +119,30 @@ def _split_payload(payload: bytes) -> tuple[bytes, bytes, bool]:
     return payload[:SALT_SIZE], payload[SALT_SIZE:], False
 
 
-def encrypt_message(plaintext: str, password: str, compress: bool = False) -> bytes:
+def encrypt_message(
+    plaintext: str, password: str, compress: Optional[bool] = None
+) -> bytes:
     """Encrypt plaintext using a password-derived key.
 
+    ``compress=None`` decides from the entropy of the message and keeps the
+    compressed form only if it is smaller; pass True or False to force it
+    either way.
+
     Returns: magic + flags + salt + fernet_token (versioned payload).
     """
 
     plaintext_bytes = _validate_plaintext(plaintext)
-    if compress:
+    if compress is None:
+        compress = False
+        if _should_compress(plaintext_bytes):
+            packed = zlib.compress(plaintext_bytes)
+            if len(packed) < len(plaintext_bytes):
+                plaintext_bytes, compress = packed, True
+    elif compress:
         plaintext_bytes = zlib.compress(plaintext_bytes)
     salt = os.urandom(SALT_SIZE)
     key = _derive_key(password, salt)
-    token = Fernet(key).encrypt(plaintext_bytes)
+    token = _fernet(key).encrypt(plaintext_bytes)
     flags = FLAG_COMPRESSED if compress else 0
     return MAGIC_HEADER + bytes([flags]) + salt + token
 
@@ -107,7 +157,7 @@ def decrypt_message(payload: bytes, password: str) -> str:
     key = _derive_key(password, salt)
 
     try:
-        plaintext_bytes = Fernet(key).decrypt(token)
+        plaintext_bytes = _fernet(key).decrypt(token)
     except InvalidToken as exc:
         raise DecryptionError("Wrong password or corrupted data.") from exc
     if compressed:
@@ -3,11 +3,14 @@ from __future__ import annotations
 import os
 import tempfile
 from pathlib import Path
+from typing import IO
 
 from flask import (
     Flask,
+    Request,
     after_this_request,
     flash,
+    g,
     redirect,
     render_template,
     request,
@@ -21,7 +24,28 @@ from Sonic_Cipher import audio_stego, security
 ALLOWED_EXTENSIONS = {".wav"}
 MAX_UPLOAD_BYTES = 25 * 1024 * 1024
 
+
+class _UploadRequest(Request):
+    """Spool file uploads straight into named temp files on disk.
+
+    The upload can then be handed to the stego engine by path instead of
+    being copied out of Werkzeug's anonymous spool file.
+    """
+
+    def _get_file_stream(
+        self,
+        total_content_length: int | None,
+        content_type: str | None,
+        filename: str | None = None,
+        content_length: int | None = None,
+    ) -> IO[bytes]:
+        stream = tempfile.NamedTemporaryFile(suffix=".wav", delete=False)
+        g.setdefault("upload_files", []).append(stream)
+        return stream
+
+
 app = Flask(__name__)
+app.request_class = _UploadRequest
 app.config["MAX_CONTENT_LENGTH"] = MAX_UPLOAD_BYTES
 app.config["SECRET_KEY"] = os.environ.get("SONIC_CIPHER_SECRET", "dev-only-change-me")
 
@@ -33,11 +57,12 @@ def _make_temp_path(suffix: str) -> str:
 
 
 def _safe_remove(path: str | None) -> None:
-    if path and os.path.exists(path):
-        try:
-            os.remove(path)
-        except OSError:
-            pass
+    if not path:
+        return
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
 
 
 def _cleanup_paths(*paths: str | None) -> None:
@@ -45,6 +70,15 @@ def _cleanup_paths(*paths: str | None) -> None:
         _safe_remove(path)
 
 
+@app.teardown_request
+def _remove_uploads(_exc: BaseException | None) -> None:
+    # Teardown runs before Flask closes the form files, and Windows cannot
+    # delete a file that is still open.
+    for stream in g.pop("upload_files", ()):
+        stream.close()
+        _safe_remove(stream.name)
+
+
 def _flash_error(message: object):
     flash(str(message), "error")
     return redirect(url_for("index"))
@@ -54,10 +88,17 @@ def _save_upload(file_storage) -> tuple[str, str]:
     if file_storage is None or not file_storage.filename:
         raise ValueError("No file selected.")
 
-    filename = secure_filename(file_storage.filename)
-    ext = Path(filename).suffix.lower()
+    # Reject on the raw name first; secure_filename is only worth running
+    # on uploads that will be accepted.
+    ext = Path(file_storage.filename).suffix.lower()
     if ext not in ALLOWED_EXTENSIONS:
         raise ValueError("Only .wav files are supported.")
+    filename = secure_filename(file_storage.filename)
+
+    stream = file_storage.stream
+    if stream in g.get("upload_files", ()):
+        stream.close()
+        return stream.name, filename
 
     temp_path = _make_temp_path(ext)
     file_storage.save(temp_path)
@@ -80,14 +121,18 @@ def hide() -> "flask.wrappers.Response":
     try:
         input_path, original_name = _save_upload(upload)
         encrypted = security.encrypt_message(message, password)
-        capacity = audio_stego.calculate_capacity(input_path)
-        if len(encrypted) > capacity:
-            raise ValueError(
-                f"Encrypted payload too large for this audio. Capacity: {capacity} bytes."
-            )
-
         output_path = _make_temp_path(".wav")
-        audio_stego.hide_data(input_path, output_path, encrypted, password)
+        try:
+            audio_stego.hide_data(input_path, output_path, encrypted, password)
+        except audio_stego.StegoError:
+            # hide_data already scans the file, so only pay for a second
+            # scan to report the capacity when the payload did not fit.
+            capacity = audio_stego.calculate_capacity(input_path)
+            if len(encrypted) > capacity:
+                raise ValueError(
+                    f"Encrypted payload too large for this audio. Capacity: {capacity} bytes."
+                ) from None
+            raise
         download_name = f"{Path(original_name).stem}_secret.wav"
 
         @after_this_request